@@ -1,5 +1,9 @@
 __author__ = 'deadblue'
 
+import sys
+from dataclasses import dataclass
+from functools import partial
+
 try:
     from enum import StrEnum
 except ImportError:
@@ -7,7 +11,14 @@ except ImportError:
     from enum import Enum
     class StrEnum(str, Enum): pass
 
+if sys.version_info >= (3, 10):
+    slotted_dataclass = partial(dataclass, slots=True)
+else:
+    # Before Python 3.10
+    slotted_dataclass = dataclass
+
 
 __all__ = [
-    'StrEnum'
+    'StrEnum',
+    'slotted_dataclass'
 ]
@@ -3,18 +3,31 @@ __author__ = 'deadblue'
 import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Union
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 from .._crypto import m115
 from ..protocol import ApiSpec, R
 from .exceptions import ApiException
 
+try:
+    import orjson
+
+    def _json_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input which json accepts, such as UTF-8 BOM
+            # and unpaired surrogate escapes.
+            return json.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
 
 JsonResult = Dict[str, Any]
 
-_ERROR_KEYS = [
-    'errcode', 'errNo', 'errno', 'code'
-]
+_ERROR_KEYS = (
+    'errno', 'errcode', 'errNo', 'code'
+)
 
 
 class JsonApiSpec(ApiSpec[R], ABC):
@@ -28,7 +41,7 @@ class JsonApiSpec(ApiSpec[R], ABC):
         return None
 
     def parse_result(self, result: bytes) -> R:
-        json_obj = json.loads(result)
+        json_obj = _json_loads(result)
         err_code = self._get_error_code(json_obj)
         if err_code > 0:
             raise ApiException(err_code, json_obj)
@@ -38,8 +51,7 @@ class JsonApiSpec(ApiSpec[R], ABC):
         if json_obj.get('state', True):
             return 0
         for err_key in _ERROR_KEYS:
-            if err_key not in json_obj: continue
-            err_code = json_obj[err_key]
+            err_code = json_obj.get(err_key)
             if isinstance(err_code, int) and err_code > 0:
                 return err_code
         return -1
@@ -68,13 +80,12 @@ class M115ApiSpec(JsonApiSpec[R], ABC):
 
     def payload(self) -> Union[bytes, None]:
         data = m115.encode(self._mkey, json.dumps(self.form))
-        return urlencode({
-            'data': data
-        }).encode()
+        # Base64 output may contain "+", "/" and "=", so it still needs quoting
+        return b'data=' + quote_plus(data).encode()
 
     def _parse_json_result(self, json_obj: JsonResult) -> R:
         m115_obj = m115.decode(self._mkey, json_obj.get('data'))
-        return self._parse_m115_result(json.loads(m115_obj))
+        return self._parse_m115_result(_json_loads(m115_obj))
     
     @abstractmethod
     def _parse_m115_result(self, m115_obj: JsonResult) -> R:
@@ -26,6 +26,10 @@ def to_https_url(url: str) -> str:
 _DATETIME_FORMAT = '%Y-%m-%d %H:%M'
 
 def to_timestamp(d: Any) -> int:
+    if type(d) is int:
+        return d
+    if type(d) is str and d.isdigit():
+        return int(d)
     if isinstance(d, int):
         return d
     if '-' in d:
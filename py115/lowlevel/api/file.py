@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from enum import IntEnum
 from typing import Dict, List, Optional, Sequence
 
-from py115.compat import StrEnum
+from py115.compat import StrEnum, slotted_dataclass
 from py115.lowlevel.protocol import RetryException
 from ._base import JsonApiSpec, JsonResult, VoidApiSpec
 from ._util import to_timestamp
@@ -16,6 +16,12 @@ class FileObject:
     FileObject represents a file/directory item in cloud storage.
     """
 
+    __slots__ = (
+        'file_id', 'parent_id', 'name', 'pickcode', 'is_dir', 'is_hidden',
+        'size', 'sha1', 'update_time', 'create_time', 'open_time',
+        'is_video', 'media_duration', 'video_definition'
+    )
+
     file_id: str
     """Unique ID of the file/directory."""
 
@@ -34,59 +40,72 @@ class FileObject:
     is_hidden: bool
     """Indicate whether file is hidden."""
 
-    size: int = 0
+    size: int
     """File size in bytes."""
 
-    sha1: Optional[str] = None
+    sha1: Optional[str]
     """File SHA-1 hash in HEX-format."""
 
     update_time: int
     """Timestamp when file is updated."""
 
-    create_time: Optional[int] = None
+    create_time: Optional[int]
     """Timestamp when file is created."""
 
-    open_time: Optional[int] = None
+    open_time: Optional[int]
     """Timestamp when file is opened."""
 
-    is_video: bool = False
+    is_video: bool
     """Indicate whether file is video."""
 
-    media_duration: Optional[int] = None
+    media_duration: Optional[int]
     """Media duration in seconds for audio/video file."""
 
-    video_definition: Optional[int] = None
+    video_definition: Optional[int]
     """Video definition for video file."""
 
     def __new__(cls, json_obj: JsonResult):
         ret = object.__new__(cls)
-        ret.is_dir = 'fid' not in json_obj
+        g, ts = json_obj.get, to_timestamp
+        ret.is_dir = is_dir = 'fid' not in json_obj
         ret.name = json_obj['n']
         ret.pickcode = json_obj['pc']
         ret.is_hidden = json_obj['hdf'] != 0
-        if 'te' in json_obj:
-            ret.update_time = to_timestamp(json_obj['te'])
-        elif 'tu' in json_obj:
-            ret.update_time = to_timestamp(json_obj['tu'])
-        if 'tp' in json_obj:
-            ret.create_time = to_timestamp(json_obj['tp'])
-        if 'to' in json_obj:
-            ret.open_time = to_timestamp(json_obj['to'])
-        if ret.is_dir:
-            ret.file_id = json_obj['cid']
-            ret.parent_id = json_obj['pid']
-        else:
-            ret.file_id = json_obj['fid']
-            ret.parent_id = json_obj['cid']
-            ret.size = json_obj['s']
-            ret.sha1 = json_obj['sha']
-            ret.is_video = json_obj.get('iv', 0) == 1
-            ret.media_duration = json_obj.get('play_long', None)
-            ret.video_definition = json_obj.get('vdi', None)
+        v = g('te')
+        if v is None:
+            v = g('tu')
+        if v is not None:
+            ret.update_time = ts(v)
+        v = g('tp')
+        ret.create_time = ts(v) if v is not None and v != '' else None
+        v = g('to')
+        ret.open_time = ts(v) if v is not None and v != '' else None
+        (_build_dir if is_dir else _build_file)(ret, json_obj)
         return ret
 
 
-@dataclass
+def _build_dir(ret: FileObject, j: JsonResult):
+    ret.file_id = j['cid']
+    ret.parent_id = j['pid']
+    ret.size = 0
+    ret.sha1 = None
+    ret.is_video = False
+    ret.media_duration = None
+    ret.video_definition = None
+
+
+def _build_file(ret: FileObject, j: JsonResult):
+    g = j.get
+    ret.file_id = j['fid']
+    ret.parent_id = j['cid']
+    ret.size = j['s']
+    ret.sha1 = j['sha']
+    ret.is_video = g('iv', 0) == 1
+    ret.media_duration = g('play_long')
+    ret.video_definition = g('vdi')
+
+
+@slotted_dataclass
 class FileListResult:
 
     files: List[FileObject]
@@ -97,56 +116,73 @@ class FileListResult:
     count: int
 
 
+_FILE_LIST_URL = 'https://webapi.115.com/files'
+_FILE_LIST_NATSORT_URL = 'https://aps.115.com/natsort/files.php'
+
 class FileListApi(JsonApiSpec[FileListResult]):
 
+    _TEMPLATE = {
+        'aid': '1',
+        'show_dir': '1',
+        'o': 'user_ptime',
+        'asc': '1',
+        'fc_mix': '0',
+        'natsort': '1',
+        'format': 'json'
+    }
+
     def __init__(self, dir_id: str, offset: int = 0, limit: int = 115) -> None:
         super().__init__('')
-        self.query.update({
-            'aid': '1',
-            'cid': dir_id,
-            'show_dir': '1',
-            'o': 'user_ptime',
-            'asc': '1',
-            'offset': str(offset),
-            'limit': str(limit),
-            'fc_mix': '0',
-            'natsort': '1',
-            'format': 'json'
-        })
+        self.query = dict(
+            self._TEMPLATE,
+            cid=dir_id,
+            offset=str(offset),
+            limit=str(limit)
+        )
+        self.set_order(self._TEMPLATE['o'])
 
     def url(self) -> str:
-        order_mode = self.query.get('o', 'user_ptime')
-        if order_mode == 'file_name':
-            return 'https://aps.115.com/natsort/files.php'
-        else:
-            return 'https://webapi.115.com/files'
+        return self._url
     
     def _get_error_code(self, json_obj: JsonResult) -> int:
         err_code = super()._get_error_code(json_obj)
         if err_code == 20130827:
-            self.query.update({
-                'o': json_obj.get('order'),
-                'asc': str(json_obj.get('is_asc'))
-            })
+            self.set_order(json_obj.get('order'))
+            self.query['asc'] = str(json_obj.get('is_asc'))
             raise RetryException()
         return err_code
 
     def _parse_json_result(self, obj: JsonResult) -> FileListResult:
-        ret = FileListResult(
-            files=[],
+        return FileListResult(
+            files=[
+                FileObject(file_obj)
+                for file_obj in obj['data']
+            ],
             order_mode=obj.get('order'),
             order_asc=obj.get('is_ac'),
             offset=obj.get('offset'),
             limit=obj.get('limit'),
             count=obj.get('count')
         )
-        for file_obj in obj['data']:
-            ret.files.append(FileObject(file_obj))
-        return ret
     
     def set_offset(self, value: int):
         self.query['offset'] = str(value)
 
+    def set_order(self, mode: str):
+        """
+        Change order mode of the file list.
+
+        Always use this instead of writing `query['o']` directly, since the
+        API endpoint depends on the order mode.
+
+        Args:
+            mode (str): Order mode, see :class:`DirOrder` for available values.
+        """
+        self.query['o'] = mode
+        if mode == DirOrder.FILE_NAME:
+            self._url = _FILE_LIST_NATSORT_URL
+        else:
+            self._url = _FILE_LIST_URL
 
 
 class FileSearchApi(JsonApiSpec[FileListResult]):
@@ -169,30 +205,30 @@ class FileSearchApi(JsonApiSpec[FileListResult]):
         })
     
     def _parse_json_result(self, json_obj: JsonResult) -> FileListResult:
-        ret = FileListResult(
-            files=[],
+        return FileListResult(
+            files=[
+                FileObject(file_obj)
+                for file_obj in json_obj['data']
+            ],
             order_mode=json_obj.get('order'),
             order_asc=json_obj.get('is_ac'),
             offset=json_obj.get('offset'),
             limit=json_obj.get('page_size'),
             count=json_obj.get('count')
         )
-        for file_obj in json_obj['data']:
-            ret.files.append(FileObject(file_obj))
-        return ret
 
     def set_offset(self, value: int):
         self.query['offset'] = str(value)
 
 
-@dataclass
+@slotted_dataclass
 class PathNode:
 
     file_id: str
     name: str
 
 
-@dataclass
+@slotted_dataclass
 class FileGetResult:
 
     name: str
@@ -208,17 +244,28 @@ class FileGetApi(JsonApiSpec[FileGetResult]):
         self.query['cid'] = file_id
     
     def _parse_json_result(self, json_obj: JsonResult) -> FileGetResult:
-        return super()._parse_json_result(json_obj)
-    
+        return FileGetResult(
+            name=json_obj['file_name'],
+            pickcode=json_obj['pick_code'],
+            is_dir=not json_obj.get('sha1'),
+            path=[
+                PathNode(
+                    file_id=str(path_obj['file_id']),
+                    name=path_obj['file_name']
+                )
+                for path_obj in json_obj.get('paths', [])
+            ]
+        )
 
 
 class FileDeleteApi(VoidApiSpec):
 
     def __init__(self, file_ids: Sequence[str]) -> None:
         super().__init__('https://webapi.115.com/rb/delete')
-        for index, file_id in enumerate(file_ids):
-            sub_key = f'fid[{index}]'
-            self.form[sub_key] = file_id
+        self.form.update({
+            f'fid[{index}]': file_id
+            for index, file_id in enumerate(file_ids)
+        })
         self.form['ignore_warn'] = '1'
 
 
@@ -227,9 +274,10 @@ class FileMoveApi(VoidApiSpec):
     def __init__(self, target_dir_id: str, file_ids: Sequence[str]) -> None:
         super().__init__('https://webapi.115.com/files/move')
         self.form['pid'] = target_dir_id
-        for index, file_id in enumerate(file_ids):
-            sub_key = f'fid[{index}]'
-            self.form[sub_key] = file_id
+        self.form.update({
+            f'fid[{index}]': file_id
+            for index, file_id in enumerate(file_ids)
+        })
         self.form['ignore_warn'] = '1'
 
 
@@ -295,7 +343,7 @@ class DirSortApi(VoidApiSpec):
         })
 
 
-@dataclass
+@slotted_dataclass
 class SpaceInfoResult:
 
     total_size: float